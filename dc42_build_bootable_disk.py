@@ -71,6 +71,13 @@ def _define_flags():
                            'matching the --floppy argument will be used'),
                      type=argparse.FileType('rb'))
 
+  flags.add_argument('-s', '--super',
+                     help=('If --bootloader is unspecified, use the built-in '
+                           '"super-VALIDATE" bootloader, which works with all '
+                           'media, instead of one matching the --floppy '
+                           'argument'),
+                     action='store_true')
+
   return flags
 
 
@@ -96,6 +103,22 @@ _FORMAT_BYTE = {'sony_400k': '\x02',  # Single-sided; "Mac 400k" interleaving.
 
 _DC42_MAGIC = '\x01\x00'  # BLU "magic number" string.
 
+# The number of sectors in track t on a 400k disk (or on one side of an 800k
+# or Twiggy disk) can be referenced in these tables as _TRACK_SIZES[floppy][t].
+_TRACK_SIZES = {
+    'sony_400k': 0x10*[0xC] + 0x10*[0xB] + 0x10*[0xA] + 0x10*[0x9] + 0x10*[0x8],
+    'sony_800k': 0x10*[0xC] + 0x10*[0xB] + 0x10*[0xA] + 0x10*[0x9] + 0x10*[0x8],
+    'twiggy': (4*[0x16] + 7*[0x15] + 6*[0x14] + 6*[0x13] + 6*[0x12] +
+               6*[0x11] + 7*[0x10] + 4*[0xF]),
+}
+
+# A "super-VALIDATE" bootloader keeps a geometry table just after this marker
+# string. The table has one byte for the number of tracks on each side of the
+# disk, then one byte for the largest sector number on each of those tracks,
+# with room for up to _GEOMETRY_MAX_TRACKS tracks.
+_GEOMETRY_MARKER = 'Tracks:'
+_GEOMETRY_MAX_TRACKS = 0x50
+
 # For the loose compatibility checks in _check_bootloader_compatibility: A
 # "Stepleton" bootloader is determined to be built for a certain floppy media
 # type if it contains all of the binary strings paired with a corresponding
@@ -108,15 +131,17 @@ _BOOTLOADER_SIGNATURES = {
     'sony_800k': ('\x4f\x07', '\x7f\xfe\x00\x00', '\x0f\x1f\x2f\x3f\xff'),
     'twiggy': (
         '\x2d\x0e', '\x7f\xfe\x00\x00', '\x03\x0a\x10\x16\x1c\x22\x29\xff'),
+    'super': (_GEOMETRY_MARKER,),
 }
 
-_BOOTLOADER_COMPATIBILITIES = {'sony_400k': {'sony_400k', 'sony_800k'},
-                               'sony_800k': {'sony_800k'},
-                               'twiggy': {'twiggy'}}
+_BOOTLOADER_COMPATIBILITIES = {'sony_400k': {'sony_400k', 'sony_800k', 'super'},
+                               'sony_800k': {'sony_800k', 'super'},
+                               'twiggy': {'twiggy', 'super'}}
 
-# Built-in "Stepleton" bootloaders for all three media types. These bootloaders
-# are the version released on 2 November 2017. If you look closely, you can see
-# that the 400k and 800k Sony bootloaders differ by just one bit!
+# Built-in "Stepleton" bootloaders for all three media types, plus the
+# "super-VALIDATE" bootloader that works with all of them. The media-specific
+# bootloaders are the version released on 2 November 2017. If you look closely,
+# you can see that the 400k and 800k Sony bootloaders differ by just one bit!
 
 _BUILT_IN_BOOTLOADERS = {
     'sony_400k': (
@@ -140,6 +165,14 @@ _BUILT_IN_BOOTLOADERS = {
         'i9yGL4sFFmBliPTvgIAJXKR/oAVk75AP4AhCAHAoB//gAAZw4Kh4AAAAAAh3////9gKAxH'
         'LQ5jBj48//9gHEH6ACAwB+BIEjwAFbAYYwRTAWD4vgFjCB48AP8CPAAaTnUDChAWHCIp/0'
         'JBRCBDSEVDS1NVTQBGTE9QUFkgRkFJTABMYXN0IG91dCEA'),
+    'super': (
+        'KngBEEH5AAIBbjA8AVcbIFHI//xO1UJlXY1djSx8AAAIAEKHHjgBs+KfUgdhIN38AAACAG'
+        'FKJk08PAAYOjwADU65AP4AiFKHYW5i+mDeIHwA/MABIk0kTiZ8APzdgUKAIgfgWSQ8AAwA'
+        'AE65AP4AlGUCTnWVykf6AN9O+QD+AIRB+gDhIk0QGLAZZwJOdUoAZvRCQCB8AAAIANBY41'
+        'i9yGL4sFFmBliPTvgIAJXKR/oAmk75AP4AhCAHAoB//gAAZwgAh3////9gIkH6AC0wB+BI'
+        'sBhkEr4wAABjFB48AP9SALAo//9lBD48//8CPAAaTnVUcmFja3M6UAsLCwsLCwsLCwsLCw'
+        'sLCwsKCgoKCgoKCgoKCgoKCgoKCQkJCQkJCQkJCQkJCQkJCQgICAgICAgICAgICAgICAgH'
+        'BwcHBwcHBwcHBwcHBwcHQkFEIENIRUNLU1VNAEZMT1BQWSBGQUlMAExhc3Qgb3V0IQA='),
 }
 
 
@@ -156,12 +189,16 @@ def main(FLAGS):
   if FLAGS.bootloader:
     bootloader_data, _ = _read_binary_data(FLAGS.bootloader, 512, 'bootloader')
   else:
-    bootloader_data = base64.decodestring(_BUILT_IN_BOOTLOADERS[FLAGS.floppy])
+    bootloader_data = base64.decodestring(
+        _BUILT_IN_BOOTLOADERS['super' if FLAGS.super else FLAGS.floppy])
     bootloader_data += '\x00' * (0x200 - len(bootloader_data))
 
   # Warn user if bootloader and floppy type may not be compatible.
   _check_bootloader_compatibility(bootloader_data, FLAGS.floppy)
 
+  # Tell "super-VALIDATE" bootloaders about the geometry of the floppy media.
+  bootloader_data = _install_geometry_table(bootloader_data, FLAGS.floppy)
+
   # Load program data; if smaller than the disk data capacity minus 512 (for the
   # sector already used by the bootloader), pad it out with zeros.
   program_data, program_size = _read_binary_data(
@@ -427,9 +464,8 @@ def _permute_data_and_tags_for_sony_800k(data, tags):
       the correct .dc42 disk image ordering.
   """
 
-  # The number of sectors in track t on a 400k disk (or on one side of an 800k
-  # disk) can be referenced in this table as track_sizes[t]:
-  track_sizes = 0x10*[0xC] + 0x10*[0xB] + 0x10*[0xA] + 0x10*[0x9] + 0x10*[0x8]
+  # The number of sectors in track t on one side of an 800k disk.
+  track_sizes = _TRACK_SIZES['sony_800k']
 
   # This is a pretty silly (O(N^2)) way to compute the cumulative sum of a
   # list, but it's adequate for our needs, and best of all, very short.
@@ -468,6 +504,37 @@ def _permute_data_and_tags_for_sony_800k(data, tags):
   return data, tags
 
 
+def _install_geometry_table(bootloader_data, floppy):
+  """Write floppy media geometry into a "super-VALIDATE" bootloader.
+
+  A "super-VALIDATE" bootloader keeps a table of the number of tracks on each
+  side of the disk and of the largest sector number on each track (see notes
+  above the definition of _GEOMETRY_MARKER). This function replaces that table
+  with one derived from _TRACK_SIZES, allowing the same bootloader to load
+  programs from any kind of floppy media. Other bootloaders have no table and
+  are returned unchanged.
+
+  Args:
+    bootloader_data: binary bootloader data.
+    floppy: string identifier for target floppy media.
+
+  Returns: `bootloader_data` with the geometry table for `floppy` installed.
+  """
+  # Locate the table; give up if this isn't a "super-VALIDATE" bootloader.
+  marker_pos = bootloader_data.find(_GEOMETRY_MARKER)
+  if marker_pos < 0: return bootloader_data
+  table_begin = marker_pos + len(_GEOMETRY_MARKER)
+  table_end = table_begin + 1 + _GEOMETRY_MAX_TRACKS
+
+  # The table is the track count followed by the largest sector number for each
+  # track, zero-padded to fill all the space set aside for it.
+  track_sizes = _TRACK_SIZES[floppy]
+  table = chr(len(track_sizes)) + ''.join(chr(s - 1) for s in track_sizes)
+  table += '\x00' * (table_end - table_begin - len(table))
+
+  return bootloader_data[:table_begin] + table + bootloader_data[table_end:]
+
+
 def _check_bootloader_compatibility(bootloader_data, floppy):
   """Perform loose checks on bootloader and floppy media compatibility.
 